@@ -144,18 +144,24 @@ async def initialize_systems():
             "skyvault_api_documentation.txt": "skyvault_api"
         }
         
+        # Read all source files concurrently; ingestion below stays sequential
+        # since Graphiti deduplicates entities against what is already in the graph
+        existing_files = [f for f in document_sources if (sample_data_path / f).exists()]
+        contents = await asyncio.gather(*(
+            asyncio.to_thread((sample_data_path / f).read_text, encoding='utf-8')
+            for f in existing_files
+        ))
+        file_contents = dict(zip(existing_files, contents))
+
         loaded_sources = 0
         # Split documents by source for KG - reuse text splitter from rag_system
         for doc_file, source_name in document_sources.items():
-            doc_path = sample_data_path / doc_file
-            if not doc_path.exists():
+            if doc_file not in file_contents:
                 console.print(f"[yellow]Warning: {doc_file} not found, skipping...[/yellow]")
                 continue
             
             console.print(f"[yellow]Adding {doc_file} to knowledge graph...[/yellow]")
-            # Load document content
-            with open(doc_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = file_contents[doc_file]
             
             # Split into chunks for KG processing using the same text splitter
             doc_chunks = rag_system.text_splitter.split_text(content)